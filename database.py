@@ -11,6 +11,11 @@ data on NEOs and close approaches extracted by `extract.load_neos` and
 
 You'll edit this file in Tasks 2 and 3.
 """
+import bisect
+import itertools
+import operator
+from array import array
+
 from excellent import Trie
 
 
@@ -49,9 +54,62 @@ class NEODatabase:
         self.designation_idx_dict = dict(zip((i.designation for i in self._neos), range(len(self._neos))))
         self.name_neo_dict = dict(zip((i.name for i in self._neos), self._neos))
         self._link_neo_approaches()
+        self._build_columns()
 
         self.tire_tree = Trie(self.name_neo_dict)
 
+    def _build_columns(self):
+        """Store the filterable fields of the close approaches as parallel columns.
+
+        The close approaches are sorted by time once into `self._sorted`, and
+        row `i` of every column describes `self._sorted[i]`, so the `date`
+        column is sorted and date ranges can be found by binary search.
+
+        Approaches without a linked NEO get a NaN diameter and a None hazardous
+        flag, so they never match a diameter or hazardous criterion.
+        """
+        nan = float('nan')
+        approaches = self._sorted = sorted(self._approaches, key=lambda a: a.time)
+        self._columns = {
+            'date': [a.date for a in approaches],
+            'distance': array('d', (a.distance for a in approaches)),
+            'velocity': array('d', (a.velocity for a in approaches)),
+            'diameter': array('d', (a.neo.diameter if a.neo else nan for a in approaches)),
+            'hazardous': [a.neo.hazardous if a.neo else None for a in approaches],
+        }
+
+    def _date_rows(self, criteria):
+        """Return the range of rows allowed by the date criteria, found by binary search."""
+        dates = self._columns['date']
+        lo, hi = 0, len(dates)
+        for column, op, value in criteria:
+            if column != 'date':
+                continue
+            if op in (operator.eq, operator.ge):
+                lo = max(lo, bisect.bisect_left(dates, value))
+            if op in (operator.eq, operator.le):
+                hi = min(hi, bisect.bisect_right(dates, value))
+        return range(lo, max(lo, hi))
+
+    def _matching_rows(self, criteria):
+        """Return the indices of the rows that satisfy every (column, comparator, value) criterion.
+
+        The date criteria narrow the rows to a contiguous range first. The
+        next criterion scans its column over that range; each following one
+        only looks at the rows that survived so far.
+        """
+        rows = self._date_rows(criteria)
+        for column, op, value in criteria:
+            if column == 'date':
+                continue
+            values = self._columns[column]
+            if isinstance(rows, range):
+                hits = map(op, values[rows.start:rows.stop], itertools.repeat(value))
+            else:
+                hits = map(op, map(values.__getitem__, rows), itertools.repeat(value))
+            rows = list(itertools.compress(rows, hits))
+        return rows
+
     def _link_neo_approaches(self):
         # ------------------------------------------------------------------------------------
         # ------------------------------------------------------------------------------------
@@ -108,7 +166,7 @@ class NEODatabase:
         # Solution 2
         return self.tire_tree.search(name.capitalize())
 
-    def query(self, filters=()):
+    def query(self, filters=None):
         """Query close approaches to generate those that match a collection of filters.
 
         This generates a stream of `CloseApproach` objects that match all of the
@@ -119,24 +177,23 @@ class NEODatabase:
         The `CloseApproach` objects are generated in internal order, which isn't
         guaranteed to be sorted meaningfully, although is often sorted by time.
 
-        :param filters: A collection of filters capturing user-specified criteria.
+        If the predicate carries a `criteria` attribute (as the ones made by
+        `create_filters` do), the criteria are evaluated over the columns built
+        in the constructor and the matches are generated in order of time;
+        otherwise the predicate is called on each approach.
+
+        :param filters: A predicate from `create_filters` capturing user-specified criteria.
         :return: A stream of matching `CloseApproach` objects.
         """
         if not filters:
             for approach in self._approaches:
                 yield approach
 
+        elif getattr(filters, 'criteria', None):
+            # Compare whole columns at once instead of one approach at a time.
+            yield from map(self._sorted.__getitem__, self._matching_rows(filters.criteria))
+
         else:
             for approach in self._approaches:
-                # Solution1:
-                # flag = True
-                # for j in filters:
-                #     if j and not j(approach):
-                #         flag = False
-                #         break
-                # if flag:
-                #     yield approach
-
-                # Solution2:
-                if all(map(lambda f: f(approach), filters)):
-                    yield approach
\ No newline at end of file
+                if filters(approach):
+                    yield approach
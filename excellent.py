@@ -1,47 +1,191 @@
 """This is the extension module.
 
-Implement a trie node improving the search efficiency.
+Implement a trie improving the search efficiency.
+
+The trie is searched through flat arrays indexed by node id instead of a tree
+of node objects. While it is being built, it is held as a ternary search tree
+of `TSTNode`s: the children of a trie node form a small binary search tree
+hanging off its `eq` link, so no per-node dictionary or wide child row is
+needed, and an in-order walk of that tree lists the children sorted.
+
+Once built, the nodes are renumbered in breadth-first order so the children
+of every node occupy consecutive ids, starting at `first_child[i]`. Each node
+keeps a 128-bit bitmap (two 64-bit words in `bitmap`) marking which ASCII
+characters have a child: the child for a character is found by counting the
+set bits below it.
+
+Chains of single-child nodes are path-compressed (as in a radix trie): each
+node carries an `edge_label` holding the characters that must follow the
+branching character leading to it.
+
+The values are kept apart from the node arrays, in a dict keyed by the id of
+the node that ends each key.
 """
+from array import array
+
+# Number of characters a node can branch on - the ASCII alphabet.
+ALPHABET_SIZE = 128
+
+# `int.bit_count` is only available from Python 3.10.
+_popcount = getattr(int, 'bit_count', lambda x: bin(x).count('1'))
+
+
+def _search_node(bitmap, first_child, edge_label, name_bytes):
+    """Walk the flat trie arrays along `name_bytes`.
+
+    Kept as a plain function over the arrays so the per-character loop only
+    touches local variables.
+
+    :param bitmap: The per-node child bitmaps, two 64-bit words per node.
+    :param first_child: The id of the first child of each node.
+    :param edge_label: The compressed characters that lead into each node.
+    :param name_bytes: The ASCII-encoded key to look up.
+    :return: The id of the node reached, or -1 if the key is not in the trie.
+    """
+    cur = 0
+    i = 0
+    n = len(name_bytes)
+    while True:
+        label = edge_label[cur]
+        if label:
+            if name_bytes[i:i + len(label)] != label:
+                return -1
+            i += len(label)
+        if i >= n:
+            return cur
+        code = name_bytes[i]
+        i += 1
+        bit = code & 63
+        word = bitmap[2 * cur + (code >> 6)]
+        if not (word >> bit) & 1:
+            return -1
+        idx = _popcount(word & ((1 << bit) - 1))
+        if code >> 6:
+            idx += _popcount(bitmap[2 * cur])
+        cur = first_child[cur] + idx
 
 
-class TrieNode:
-    """Trie node is the basic element of a trie tree."""
+class TSTNode:
+    """Ternary search tree node used while building a `Trie`.
 
-    def __init__(self):
-        """Init child_node dictionary."""
-        self.child_node = {}
+    A node stands for the trie node reached through character `ch`. Its `lo`
+    and `hi` links lead to siblings with smaller and larger characters, and
+    `eq` leads to the tree of its own children.
+    """
+
+    __slots__ = ('ch', 'lo', 'eq', 'hi', 'isEnd')
+
+    def __init__(self, ch):
+        """Init an unlinked node for character `ch`."""
+        self.ch = ch
+        self.lo = None
+        self.eq = None
+        self.hi = None
         self.isEnd = None
 
+    def children(self):
+        """Return the child nodes sorted by character, via an in-order walk of `eq`."""
+        out = []
+        stack = []
+        cur = self.eq
+        while stack or cur is not None:
+            while cur is not None:
+                stack.append(cur)
+                cur = cur.lo
+            cur = stack.pop()
+            out.append(cur)
+            cur = cur.hi
+        return out
+
 
 class Trie:
     """Trie is used in get_neo_name in database.py."""
 
     def __init__(self, mapping_dict):
-        """Create the root trie node and build the tree once it is initiated."""
-        self.tree = TrieNode()
+        """Create the root node and build the tree once it is initiated."""
+        # The root stands for the empty prefix; its character is never compared.
+        self.tree = TSTNode('')
         self._make_trie_tree(mapping_dict)
+        self._compact_bfs()
 
     def _make_trie_tree(self, mapping_dict):
         """Create a trie tree."""
         for name, searching_obj in mapping_dict.items():
-            cur_node = self.tree
             if name is None:
                 continue
+            cur_node = self.tree
             for ch in name:
-                if ch not in cur_node.child_node:
-                    cur_node.child_node[ch] = TrieNode()
-                cur_node = cur_node.child_node[ch]
-            # print(searching_obj) # debug
+                if ord(ch) >= ALPHABET_SIZE:
+                    raise ValueError(f"Trie keys must be ASCII, got {name!r}.")
+                if cur_node.eq is None:
+                    cur_node.eq = TSTNode(ch)
+                    cur_node = cur_node.eq
+                    continue
+                cur_node = cur_node.eq
+                while ch != cur_node.ch:
+                    if ch < cur_node.ch:
+                        if cur_node.lo is None:
+                            cur_node.lo = TSTNode(ch)
+                        cur_node = cur_node.lo
+                    else:
+                        if cur_node.hi is None:
+                            cur_node.hi = TSTNode(ch)
+                        cur_node = cur_node.hi
             cur_node.isEnd = searching_obj
 
+    def _compact_bfs(self):
+        """Renumber the nodes layer by layer so that siblings are contiguous.
+
+        Chains of nodes with a single child and no value are collapsed into
+        the node at the end of the chain, whose `edge_label` keeps the
+        skipped characters.
+        """
+        def collapse(node):
+            label = bytearray()
+            while node.isEnd is None:
+                only = node.eq
+                if only is None or only.lo is not None or only.hi is not None:
+                    break
+                node = only
+                label.append(ord(node.ch))
+            return node, bytes(label)
+
+        root, root_label = collapse(self.tree)
+        order = [root]
+        edge_label = [root_label]
+        bitmap = array('Q')
+        first_child = array('i')
+        head = 0
+        # `order` doubles as the BFS queue: children are appended right after
+        # their parent's `first_child` offset is recorded.
+        while head < len(order):
+            words = [0, 0]
+            first_child.append(len(order))
+            for child in order[head].children():
+                code = ord(child.ch)
+                words[code >> 6] |= 1 << (code & 63)
+                node, label = collapse(child)
+                order.append(node)
+                edge_label.append(label)
+            bitmap.extend(words)
+            head += 1
+
+        del self.tree
+        self.n_nodes = len(order)
+        self.bitmap = bitmap
+        self.first_child = first_child
+        self.edge_label = edge_label
+        # Only the nodes that end a key hold a value, so keep them in a dict.
+        self._terminals = {i: node.isEnd for i, node in enumerate(order) if node.isEnd is not None}
+
     def search(self, name):
         """Search function."""
-        cur_node = self.tree
-        for ch in name:
-            if ch not in cur_node.child_node:
-                return None
-            cur_node = cur_node.child_node[ch]
-        return cur_node.isEnd
+        try:
+            name_bytes = name.encode('ascii')
+        except UnicodeEncodeError:
+            return None
+        node = _search_node(self.bitmap, self.first_child, self.edge_label, name_bytes)
+        return self._terminals.get(node)
 
 
 if __name__ == '__main__':
@@ -51,4 +195,4 @@ if __name__ == '__main__':
         'may': 'ban'
     }
     t = Trie(test_dict)
-    print(t.search('alex2'))
\ No newline at end of file
+    print(t.search('alex2'))
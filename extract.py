@@ -14,6 +14,12 @@ You'll edit this file in Task 2.
 """
 import csv
 import json
+import sys
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from models import NearEarthObject, CloseApproach
 
@@ -26,21 +32,23 @@ def load_neos(neo_csv_path):
     :return: A collection of `NearEarthObject`s.
     """
     with open(neo_csv_path, "r") as file:
-        reader = csv.DictReader(file)
+        reader = csv.reader(file)
+        # Resolve the column positions once from the header row.
+        header = next(reader)
+        i_pdes = header.index("pdes")
+        i_name = header.index("name")
+        i_diameter = header.index("diameter")
+        i_pha = header.index("pha")
+
         neo_obj_arr = []
         for row in reader:
-            row["name"] = row["name"] or None
-            row["diameter"] = float(row["diameter"]) if row["diameter"] else None
-            row["pha"] = False if row["pha"] in ["", "N"] else True
-
-            neo = NearEarthObject(
-                designation=row["pdes"],
-                name=row["name"],
-                diameter=row["diameter"],
-                hazardous=row["pha"]
-            )
-
-            neo_obj_arr.append(neo)
+            diameter = row[i_diameter]
+            neo_obj_arr.append(NearEarthObject(
+                sys.intern(row[i_pdes]),
+                row[i_name] or None,
+                float(diameter) if diameter else None,
+                row[i_pha] not in ("", "N")
+            ))
 
     return neo_obj_arr
 
@@ -54,22 +62,27 @@ def load_approaches(cad_json_path):
     :param cad_json_path: A path to a JSON file containing data about close approaches.
     :return: A collection of `CloseApproach`es.
     """
-    ca_obj_arr = []
-    with open(cad_json_path) as f:
-        loader = json.load(f)
-        ca_arr = [dict(zip(loader["fields"], i)) for i in loader['data']]
-
-        for row in ca_arr:
-            ca_info = {
-                'designation': row['des'],
-                'time': row['cd'],
-                'distance': row['dist'],
-                'velocity': row['v_rel']
-            }
-
-            ca_obj_arr.append(CloseApproach(**ca_info))
-
-        f.close()
+    # orjson is an optional, faster drop-in for parsing the large cad.json file.
+    with open(cad_json_path, 'rb') as f:
+        loader = orjson.loads(f.read()) if orjson else json.load(f)
+
+    # Resolve the field positions once instead of building a dict per row.
+    # Designations repeat across rows and key the NEO lookups, so intern them.
+    fields = loader["fields"]
+    i_des = fields.index("des")
+    i_cd = fields.index("cd")
+    i_dist = fields.index("dist")
+    i_v_rel = fields.index("v_rel")
+
+    ca_obj_arr = [
+        CloseApproach(
+            designation=sys.intern(row[i_des]),
+            time=row[i_cd],
+            distance=row[i_dist],
+            velocity=row[i_v_rel]
+        )
+        for row in loader["data"]
+    ]
     return ca_obj_arr
 
 
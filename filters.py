@@ -1,15 +1,19 @@
 """Provide filters for querying close approaches and limit the generated results.
 
-The `create_filters` function produces a collection of objects that is used by
-the `query` method to generate a stream of `CloseApproach` objects that match
-all of the desired criteria. The arguments to `create_filters` are provided by
-the main module and originate from the user's command-line options.
+The `create_filters` function produces a single predicate that is used by the
+`query` method to generate a stream of `CloseApproach` objects that match all of
+the desired criteria. The arguments to `create_filters` are provided by the main
+module and originate from the user's command-line options.
 
-This function can be thought to return a collection of instances of subclasses
-of `AttributeFilter` - a 1-argument callable (on a `CloseApproach`) constructed
-from a comparator (from the `operator` module), a reference value, and a class
-method `get` that subclasses can override to fetch an attribute of interest from
-the supplied `CloseApproach`.
+The predicate is generated for the criteria at hand: its source inlines exactly
+the active comparisons, joined with `and`, so evaluating it on an approach costs
+no per-filter dispatch at all.
+
+The subclasses of `AttributeFilter` are still available as standalone filters:
+each is a 1-argument callable (on a `CloseApproach`) constructed from a
+comparator (from the `operator` module), a reference value, and a class method
+`get` that subclasses can override to fetch an attribute of interest from the
+supplied `CloseApproach`.
 
 The `limit` function simply limits the maximum number of values produced by an
 iterator.
@@ -24,6 +28,16 @@ class UnsupportedCriterionError(NotImplementedError):
     """A filter criterion is unsupported."""
 
 
+# Comparators that `AttributeFilter` evaluates with an inline comparison.
+_OPERATOR_KINDS = {
+    operator.lt: 0,
+    operator.le: 1,
+    operator.eq: 2,
+    operator.ge: 3,
+    operator.gt: 4,
+}
+
+
 class AttributeFilter:
     """A general superclass for filters on comparable attributes.
 
@@ -53,10 +67,27 @@ class AttributeFilter:
         """
         self.operator = op
         self.value = value
+        self._kind = _OPERATOR_KINDS.get(op)
 
     def __call__(self, approach):
-        """Invoke `self(approach)`."""
-        return self.operator(self.get(approach), self.value)
+        """Invoke `self(approach)`.
+
+        The common comparators are evaluated inline rather than through a call
+        to the operator function; any other comparator is called as given.
+        """
+        x = self.get(approach)
+        kind = self._kind
+        if kind == 1:
+            return x <= self.value
+        elif kind == 3:
+            return x >= self.value
+        elif kind == 2:
+            return x == self.value
+        elif kind == 0:
+            return x < self.value
+        elif kind == 4:
+            return x > self.value
+        return self.operator(x, self.value)
 
     @classmethod
     def get(cls, approach):
@@ -82,7 +113,7 @@ class TimeFilter(AttributeFilter):
     @classmethod
     def get(cls, approach):
         """Get the date."""
-        return approach.time.date()
+        return approach.date
 
 
 class DistanceFilter(AttributeFilter):
@@ -142,8 +173,12 @@ def create_filters(
     `hazardous=False`, not to be confused with `hazardous=None`).
 
     The return value must be compatible with the `query` method of `NEODatabase`
-    because the main module directly passes this result to that method. For now,
-    this can be thought of as a collection of `AttributeFilter`s.
+    because the main module directly passes this result to that method. It is a
+    single predicate on a `CloseApproach` that is true when every given
+    criterion holds, or None when no criteria are given. The predicate's
+    `criteria` attribute lists the same criteria as (column, comparator, value)
+    triples, where the column is one of 'date', 'distance', 'velocity',
+    'diameter' or 'hazardous'.
 
     :param date: A `date` on which a matching `CloseApproach` occurs.
     :param start_date: A `date` on or after which a matching `CloseApproach` occurs.
@@ -155,40 +190,71 @@ def create_filters(
     :param diameter_min: A minimum diameter of the NEO of a matching `CloseApproach`.
     :param diameter_max: A maximum diameter of the NEO of a matching `CloseApproach`.
     :param hazardous: Whether the NEO of a matching `CloseApproach` is potentially hazardous.
-    :return: A collection of filters for use with `query`.
+    :return: A predicate on a `CloseApproach` for use with `query`, or None.
     """
-    date_filter_f = TimeFilter(operator.eq, date) if date else None
-
-    date_start_filter_f = TimeFilter(operator.ge, start_date) if start_date else None
-    date_end_filter_f = TimeFilter(operator.le, end_date) if end_date else None
-
-    distance_min_filter_f = DistanceFilter(operator.ge, distance_min) if distance_min else None
-    distance_max_filter_f = DistanceFilter(operator.le, distance_max) if distance_max else None
-
-    velocity_min_filter_f = VelocityFilter(operator.ge, velocity_min) if velocity_min else None
-    velocity_max_filter_f = VelocityFilter(operator.le, velocity_max) if velocity_max else None
-
-    diameter_min_filter_f = DiameterFilter(operator.ge, diameter_min) if diameter_min else None
-    diameter_max_filter_f = DiameterFilter(operator.le, diameter_max) if diameter_max else None
-
-    # note:
-    # if hazardous else None - fails the tests
-    hazardous_filter_f = HazardousFilter(operator.eq, hazardous) if hazardous is not None else None
-
-    filter_arr = [
-        date_filter_f,
-        date_start_filter_f,
-        date_end_filter_f,
-        distance_min_filter_f,
-        distance_max_filter_f,
-        velocity_min_filter_f,
-        velocity_max_filter_f,
-        diameter_min_filter_f,
-        diameter_max_filter_f,
-        hazardous_filter_f
-    ]
+    criteria = []
+    if date is not None:
+        criteria.append(('date', operator.eq, date))
+    if start_date is not None:
+        criteria.append(('date', operator.ge, start_date))
+    if end_date is not None:
+        criteria.append(('date', operator.le, end_date))
+    if distance_min is not None:
+        criteria.append(('distance', operator.ge, distance_min))
+    if distance_max is not None:
+        criteria.append(('distance', operator.le, distance_max))
+    if velocity_min is not None:
+        criteria.append(('velocity', operator.ge, velocity_min))
+    if velocity_max is not None:
+        criteria.append(('velocity', operator.le, velocity_max))
+    if diameter_min is not None:
+        criteria.append(('diameter', operator.ge, diameter_min))
+    if diameter_max is not None:
+        criteria.append(('diameter', operator.le, diameter_max))
+    if hazardous is not None:
+        criteria.append(('hazardous', operator.eq, hazardous))
+
+    if not criteria:
+        return None
+    return _compile_predicate(criteria)
+
+
+# Source expressions for each column, and for each comparator, used to
+# generate the predicate returned by `create_filters`.
+_COLUMN_EXPRESSIONS = {
+    'date': 'a.date',
+    'distance': 'a.distance',
+    'velocity': 'a.velocity',
+    'diameter': 'a.neo.diameter',
+    'hazardous': 'a.neo.hazardous',
+}
+_OPERATOR_SYMBOLS = {
+    operator.eq: '==',
+    operator.ge: '>=',
+    operator.le: '<=',
+}
+
+
+def _compile_predicate(criteria):
+    """Generate a predicate function that inlines exactly the given criteria.
+
+    For example, a minimum distance and a hazardous flag produce the function
+    `def match(a): return a.distance >= v0 and a.neo.hazardous == v1`, with the
+    reference values bound as globals of the generated code.
+
+    :param criteria: A sequence of (column, comparator, value) triples.
+    :return: The predicate, with the criteria attached as its `criteria` attribute.
+    """
+    namespace = {}
+    terms = []
+    for i, (column, op, value) in enumerate(criteria):
+        namespace[f'v{i}'] = value
+        terms.append(f'{_COLUMN_EXPRESSIONS[column]} {_OPERATOR_SYMBOLS[op]} v{i}')
+    exec(f"def match(a):\n    return {' and '.join(terms)}\n", namespace)
 
-    return [i for i in filter_arr if i]
+    match = namespace['match']
+    match.criteria = tuple(criteria)
+    return match
 
 
 def limit(iterator, n=None):
@@ -200,4 +266,4 @@ def limit(iterator, n=None):
     :param n: The maximum number of values to produce.
     :yield: The first (at most) `n` values from the iterator.
     """
-    return iterator if not n else list(itertools.islice(iterator, 0, n))
+    return iterator if not n else itertools.islice(iterator, n)
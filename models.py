@@ -33,18 +33,24 @@ class NearEarthObject:
     `NEODatabase` constructor.
     """
 
+    # Fixed attribute slots instead of a per-instance `__dict__`.
+    __slots__ = ('designation', 'name', 'diameter', 'hazardous', 'approaches')
+
     # If you make changes, be sure to update the comments in this file.
-    def __init__(self, **info):
+    def __init__(self, designation=None, name=None, diameter=None, hazardous=None):
         """Create a new `NearEarthObject`.
 
-        :param info: A dictionary of excess keyword arguments supplied to the constructor.
+        :param designation: The primary designation of the NEO.
+        :param name: The IAU name of the NEO, or None.
+        :param diameter: The diameter of the NEO in kilometers, or None if unknown.
+        :param hazardous: Whether the NEO is potentially hazardous.
         """
-        self.designation = info.get("designation")
-        self.name = info.get("name")
-        self.diameter = info.get("diameter")
+        self.designation = designation
+        self.name = name
+        self.diameter = diameter
         if not self.diameter:
             self.diameter = float('nan')
-        self.hazardous = info.get("hazardous")
+        self.hazardous = hazardous
 
         # Create an empty initial collection of linked approaches.
         self.approaches = []
@@ -91,6 +97,9 @@ class CloseApproach:
     `NEODatabase` constructor.
     """
 
+    # Fixed attribute slots instead of a per-instance `__dict__`.
+    __slots__ = ('_designation', 'time', 'date', 'distance', 'velocity', 'neo')
+
     # If you make changes, be sure to update the comments in this file.
     def __init__(self, **info):
         """Create a new `CloseApproach`.
@@ -104,6 +113,8 @@ class CloseApproach:
         self._designation = info['designation']
         # note: Use the cd_to_datetime function for this attribute.
         self.time = cd_to_datetime(info['time'])
+        # The calendar date is what date filters compare against, so compute it once.
+        self.date = self.time.date()
         self.distance = float(info['distance'])
         self.velocity = float(info['velocity'])
 
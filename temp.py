@@ -3,14 +3,15 @@ import pandas as pd
 import json
 from collections import Counter
 
-df = pd.DataFrame()
+from models import NearEarthObject
 
 filename = 'data/neos.csv'
 
-
-chunksize = 1e6
-for chunk in pd.read_csv(filename, chunksize=chunksize):
-    df = df.append(chunk)
+# A single read of the needed columns - appending chunk by chunk copies the
+# whole frame on every chunk.
+df = pd.read_csv(filename, usecols=['pdes', 'name', 'diameter', 'pha'],
+                 dtype={'pdes': str, 'name': str, 'diameter': float, 'pha': str},
+                 na_values=['', ' '])
 
 print(len(df))
 print(df['pdes'][0])
@@ -18,6 +19,13 @@ print(len(df[df['name'] == 'IAU']))
 print(df.columns.values)
 print(df.diameter.isna().sum())
 print(df['diameter'][:50])
+
+pdes = df['pdes'].to_numpy()
+names = df['name'].astype(object).where(df['name'].notna(), None).to_numpy()
+diameters = df['diameter'].to_numpy()
+hazardous = (df['pha'] == 'Y').to_numpy()
+neos = [NearEarthObject(p, n, d, bool(h)) for p, n, d, h in zip(pdes, names, diameters, hazardous)]
+print(len(neos))
 #
 # def load_json(filename='./data/cad.json'):
 #     with open(filename) as f:
@@ -528,6 +528,24 @@ class TestQuery(unittest.TestCase):
         received = set(self.db.query(filters))
         self.assertEqual(expected, received, msg="Computed results do not match expected results.")
 
+    def test_query_with_zero_max_distance(self):
+        # A bound of 0.0 is a real criterion, not a missing one.
+        filters = create_filters(distance_max=0.0)
+        received = set(self.db.query(filters))
+        self.assertEqual(set(), received, msg="Computed results do not match expected results.")
+
+    def test_query_predicate_agrees_with_column_criteria(self):
+        filters = create_filters(
+            start_date=datetime.date(2020, 3, 1), end_date=datetime.date(2020, 5, 31),
+            distance_max=0.4, velocity_min=10, diameter_max=1.5, hazardous=False
+        )
+        expected = set(self.db.query(filters))
+        self.assertGreater(len(expected), 0)
+
+        # Without a `criteria` attribute, the database calls the predicate on each approach.
+        received = set(self.db.query(lambda approach: filters(approach)))
+        self.assertEqual(expected, received, msg="Computed results do not match expected results.")
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,67 @@
+"""Check that the `Trie` from the extension module finds values by key.
+
+To run these tests from the project root, run:
+
+    $ python3 -m unittest --verbose tests.test_trie
+"""
+import unittest
+
+from excellent import Trie, TSTNode
+
+
+class TestTrie(unittest.TestCase):
+    def setUp(self):
+        self.mapping = {
+            'alex1': 'Tom',
+            'alex2': 'Jack',
+            'alex': 'Alex',
+            'may': 'ban',
+            None: 'nameless',
+        }
+        self.trie = Trie(self.mapping)
+
+    def test_search_finds_every_key(self):
+        for name, value in self.mapping.items():
+            if name is not None:
+                self.assertEqual(self.trie.search(name), value)
+
+    def test_search_prefix_without_value(self):
+        self.assertIsNone(self.trie.search('ale'))
+        self.assertIsNone(self.trie.search('ma'))
+
+    def test_search_missing_key(self):
+        self.assertIsNone(self.trie.search('alex3'))
+        self.assertIsNone(self.trie.search('bob'))
+        self.assertIsNone(self.trie.search('alex12'))
+
+    def test_children_are_contiguous(self):
+        trie = self.trie
+        for node in range(trie.n_nodes - 1):
+            n_kids = bin(trie.bitmap[2 * node]).count('1') + bin(trie.bitmap[2 * node + 1]).count('1')
+            self.assertEqual(trie.first_child[node] + n_kids, trie.first_child[node + 1])
+
+    def test_single_child_chains_are_compressed(self):
+        trie = Trie({'alex1': 'Tom', 'alex2': 'Jack'})
+        self.assertEqual(trie.n_nodes, 3)
+        self.assertEqual(trie.edge_label[0], b'alex')
+        self.assertEqual(trie.search('alex1'), 'Tom')
+        self.assertIsNone(trie.search('alex'))
+        self.assertIsNone(trie.search('alx1'))
+
+    def test_tst_children_are_sorted(self):
+        root = TSTNode('')
+        root.eq = TSTNode('m')
+        root.eq.lo = TSTNode('c')
+        root.eq.hi = TSTNode('x')
+        root.eq.lo.hi = TSTNode('f')
+        self.assertEqual([node.ch for node in root.children()], ['c', 'f', 'm', 'x'])
+
+    def test_search_empty_trie(self):
+        self.assertIsNone(Trie({}).search('alex'))
+
+    def test_search_non_ascii_key(self):
+        self.assertIsNone(self.trie.search('mäy'))
+
+
+if __name__ == '__main__':
+    unittest.main()